@@ -4,12 +4,61 @@ XCFramework 构建器
 用于从 Xcode 项目构建 XCFramework
 """
 
+import functools
 import os
 import subprocess
 import shutil
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+try:
+    # 可选依赖：orjson 序列化更快，未安装时回退到标准库 json
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+
+
+# xcodebuild 输出按块写入日志文件，内存中只保留最后若干行用于失败时显示
+_LOG_CHUNK_SIZE = 64 * 1024
+_LOG_TAIL_LINES = 200
+
+
+def _write_json(path: Path, data: Dict[str, Any]):
+    """以2空格缩进写入JSON文件（UTF-8，不转义非ASCII字符）"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def _find_framework(root: str, framework_name: str) -> Optional[str]:
+    """在构建目录中查找 Framework，找到第一个即返回（跳过 DerivedData 中间产物）"""
+    for dirpath, dirnames, _ in os.walk(root):
+        if framework_name in dirnames:
+            return os.path.join(dirpath, framework_name)
+        if 'DerivedData' in dirnames:
+            dirnames.remove('DerivedData')
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _xcodebuild_version() -> tuple:
+    """查询 Xcode 版本（进程内缓存），返回 (返回码, 标准输出)"""
+    result = subprocess.run(['xcodebuild', '-version'], capture_output=True, text=True)
+    return result.returncode, result.stdout
+
+
+@functools.lru_cache(maxsize=1)
+def _xcodebuild_sdks() -> tuple:
+    """查询可用 SDK 列表（进程内缓存），返回 (返回码, 标准输出)"""
+    result = subprocess.run(['xcodebuild', '-showsdks'], capture_output=True, text=True)
+    return result.returncode, result.stdout
 
 
 @dataclass
@@ -19,6 +68,10 @@ class BuildTarget:
     sdk: str
     destination: str
     arch: List[str]
+    archs_str: str = field(init=False)
+    
+    def __post_init__(self):
+        self.archs_str = ' '.join(self.arch)
 
 
 @dataclass
@@ -36,7 +89,8 @@ class XCFrameworkConfig:
 class XCFrameworkBuilder:
     """XCFramework 构建器"""
     
-    def __init__(self):
+    def __init__(self, verbose: bool = False):
+        self.verbose = verbose
         self.default_targets = [
             BuildTarget(
                 name="iOS",
@@ -71,10 +125,19 @@ class XCFrameworkBuilder:
             if config.clean_build:
                 self._clean_build_directory(config)
             
-            # 3. 为每个目标平台构建 Framework
+            # 3. 并行为每个目标平台构建 Framework（各目标写入独立的构建目录）
+            workers = max(1, len(config.targets))
+            jobs = max(1, (os.cpu_count() or 1) // workers)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(self._build_framework_for_target, config, target, jobs)
+                    for target in config.targets
+                ]
+                # 按目标顺序收集结果，保证 XCFramework 中的切片顺序稳定
+                results = [future.result() for future in futures]
+            
             framework_paths = []
-            for target in config.targets:
-                framework_path = self._build_framework_for_target(config, target)
+            for target, framework_path in zip(config.targets, results):
                 if framework_path:
                     framework_paths.append(framework_path)
                 else:
@@ -103,22 +166,21 @@ class XCFrameworkBuilder:
         """检查构建环境"""
         try:
             # 检查 Xcode 是否安装
-            result = subprocess.run(['xcodebuild', '-version'], 
-                                  capture_output=True, text=True)
-            if result.returncode != 0:
+            returncode, output = _xcodebuild_version()
+            if returncode != 0:
                 print("❌ Xcode 未安装或不可用")
                 return False
             
-            print(f"✅ Xcode 版本: {result.stdout.strip().split()[1]}")
+            print(f"✅ Xcode 版本: {output.strip().split()[1]}")
             
-            # 检查可用的 SDK
-            result = subprocess.run(['xcodebuild', '-showsdks'], 
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
-                print("✅ 可用的 SDK:")
-                for line in result.stdout.split('\n'):
-                    if 'iOS' in line or 'macOS' in line:
-                        print(f"   {line.strip()}")
+            # 可用的 SDK 仅用于展示，详细模式下才查询
+            if self.verbose:
+                returncode, output = _xcodebuild_sdks()
+                if returncode == 0:
+                    print("✅ 可用的 SDK:")
+                    for line in output.split('\n'):
+                        if 'iOS' in line or 'macOS' in line:
+                            print(f"   {line.strip()}")
             
             return True
             
@@ -138,8 +200,9 @@ class XCFrameworkBuilder:
         if xcframework_path.exists():
             shutil.rmtree(xcframework_path)
     
-    def _build_framework_for_target(self, config: XCFrameworkConfig, target: BuildTarget) -> Optional[str]:
-        """为特定目标构建 Framework"""
+    def _build_framework_for_target(self, config: XCFrameworkConfig, target: BuildTarget,
+                                    jobs: Optional[int] = None) -> Optional[str]:
+        """为特定目标构建 Framework，jobs 限制 xcodebuild 的并发编译任务数"""
         try:
             print(f"🔨 构建 {target.name} Framework...")
             
@@ -150,12 +213,14 @@ class XCFrameworkBuilder:
             # 构建命令
             cmd = [
                 'xcodebuild',
+                '-quiet',
                 '-project', config.project_path,
                 '-scheme', config.scheme_name,
                 '-configuration', config.configuration,
                 '-sdk', target.sdk,
                 '-destination', target.destination,
-                'BUILD_DIR=' + str(build_dir),
+                '-derivedDataPath', str(build_dir / "DerivedData"),
+                f'BUILD_DIR={build_dir}',
                 'SKIP_INSTALL=NO',
                 'BUILD_LIBRARY_FOR_DISTRIBUTION=YES',
                 'ONLY_ACTIVE_ARCH=NO'
@@ -163,49 +228,41 @@ class XCFrameworkBuilder:
             
             # 添加架构设置
             if len(target.arch) > 1:
-                cmd.extend(['ARCHS=' + ' '.join(target.arch)])
+                cmd.append(f'ARCHS={target.archs_str}')
+            
+            # 多个目标并行构建时，限制每个 xcodebuild 的并发任务数以免超额占用CPU
+            if jobs:
+                cmd.extend(['-jobs', str(jobs)])
             
             cmd.append('build')
             
-            print(f"   执行命令: {' '.join(cmd)}")
+            if self.verbose:
+                print(f"   执行命令: {' '.join(cmd)}")
             
             # 执行构建
-            result = subprocess.run(cmd, capture_output=True, text=True, cwd=Path(config.project_path).parent)
+            log_path = build_dir / "xcodebuild.log"
+            returncode, output_tail = self._run_logged(cmd, log_path, cwd=Path(config.project_path).parent)
             
-            if result.returncode != 0:
+            if returncode != 0:
                 print(f"❌ 构建失败: {target.name}")
-                print(f"错误输出: {result.stderr}")
+                print(f"错误输出 (完整日志: {log_path}):\n{output_tail}")
                 return None
             
             # 查找生成的 Framework
             framework_name = f"{config.framework_name}.framework"
-            
-            # 可能的 Framework 路径
-            possible_paths = [
-                build_dir / config.configuration / framework_name,
-                build_dir / f"{config.configuration}-{target.sdk}" / framework_name,
-                build_dir / "Products" / config.configuration / framework_name,
-                build_dir / "Products" / f"{config.configuration}-{target.sdk}" / framework_name
-            ]
-            
-            for path in possible_paths:
-                if path.exists():
-                    print(f"✅ 找到 Framework: {path}")
-                    return str(path)
-            
-            # 如果没找到，搜索整个构建目录
-            for framework_path in build_dir.rglob(framework_name):
-                if framework_path.is_dir():
-                    print(f"✅ 找到 Framework: {framework_path}")
-                    return str(framework_path)
+            framework_path = _find_framework(str(build_dir), framework_name)
+            if framework_path:
+                print(f"✅ 找到 Framework: {framework_path}")
+                return framework_path
             
             print(f"❌ 未找到生成的 Framework: {framework_name}")
-            print(f"构建目录内容:")
-            for item in build_dir.rglob("*"):
-                if item.is_dir():
-                    print(f"   📁 {item}")
-                else:
-                    print(f"   📄 {item}")
+            if self.verbose:
+                print(f"构建目录内容:")
+                for item in build_dir.rglob("*"):
+                    if item.is_dir():
+                        print(f"   📁 {item}")
+                    else:
+                        print(f"   📄 {item}")
             
             return None
             
@@ -228,14 +285,17 @@ class XCFrameworkBuilder:
             
             cmd.extend(['-output', str(xcframework_path)])
             
-            print(f"   执行命令: {' '.join(cmd)}")
+            if self.verbose:
+                print(f"   执行命令: {' '.join(cmd)}")
             
             # 执行命令
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            log_path = Path(config.output_dir) / "build" / "create_xcframework.log"
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            returncode, output_tail = self._run_logged(cmd, log_path)
             
-            if result.returncode != 0:
+            if returncode != 0:
                 print(f"❌ 创建 XCFramework 失败")
-                print(f"错误输出: {result.stderr}")
+                print(f"错误输出 (完整日志: {log_path}):\n{output_tail}")
                 return None
             
             if xcframework_path.exists():
@@ -248,6 +308,28 @@ class XCFrameworkBuilder:
             print(f"❌ 创建 XCFramework 失败: {e}")
             return None
     
+    def _run_logged(self, cmd: List[str], log_path: Path, cwd: Optional[Path] = None) -> tuple:
+        """执行命令并将输出流式写入日志文件，返回 (返回码, 失败时的输出尾部)"""
+        # 按行保留尾部：read1 返回的块边界与行边界无关，未结束的最后一行与下一块拼接
+        tail = deque(maxlen=_LOG_TAIL_LINES)
+        pending = b''
+        with open(log_path, 'wb') as log_file:
+            with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, cwd=cwd) as proc:
+                for chunk in iter(lambda: proc.stdout.read1(_LOG_CHUNK_SIZE), b''):
+                    log_file.write(chunk)
+                    lines = (pending + chunk).splitlines(keepends=True)
+                    pending = lines.pop() if not lines[-1].endswith((b'\n', b'\r')) else b''
+                    tail.extend(lines)
+                returncode = proc.wait()
+        if pending:
+            tail.append(pending)
+        
+        if returncode == 0:
+            return returncode, ""
+        
+        # 仅在失败时解码尾部输出
+        return returncode, b''.join(tail).decode('utf-8', errors='replace').rstrip('\r\n')
+    
     def _validate_xcframework(self, xcframework_path: str) -> bool:
         """验证 XCFramework"""
         try:
@@ -301,9 +383,14 @@ class XCFrameworkBuilder:
     def _get_directory_size(self, path: Path) -> float:
         """获取目录大小（MB）"""
         total_size = 0
-        for file_path in path.rglob('*'):
-            if file_path.is_file():
-                total_size += file_path.stat().st_size
+        stack = [str(path)]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        total_size += entry.stat(follow_symlinks=False).st_size
         return total_size / (1024 * 1024)
     
     def _generate_build_summary(self, config: XCFrameworkConfig, xcframework_path: str):
@@ -311,7 +398,6 @@ class XCFrameworkBuilder:
         try:
             summary_path = Path(config.output_dir) / "xcframework_build_summary.json"
             
-            import json
             from datetime import datetime
             
             summary = {
@@ -327,11 +413,11 @@ class XCFrameworkBuilder:
                     }
                     for target in config.targets
                 ],
-                'file_size_mb': self._get_directory_size(Path(xcframework_path))
+                # 保留4位小数：json 与 orjson 对 1e-4 以下的浮点数写法不同（1e-05 / 0.00001）
+                'file_size_mb': round(self._get_directory_size(Path(xcframework_path)), 4)
             }
             
-            with open(summary_path, 'w', encoding='utf-8') as f:
-                json.dump(summary, f, indent=2, ensure_ascii=False)
+            _write_json(summary_path, summary)
             
             print(f"📄 构建摘要已保存: {summary_path}")
             
@@ -3,15 +3,18 @@ Xcode项目生成器
 用于生成Framework项目的.xcodeproj文件和相关配置
 """
 
-import os
+import functools
+import hashlib
 import json
-import uuid
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class XcodeTarget:
     """Xcode目标配置"""
     name: str
@@ -19,10 +22,10 @@ class XcodeTarget:
     product_type: str
     build_configurations: Dict[str, Dict[str, Any]]
     build_phases: List[Dict[str, Any]]
-    dependencies: List[str] = None
+    dependencies: Tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class XcodeProject:
     """Xcode项目配置"""
     name: str
@@ -32,11 +35,480 @@ class XcodeProject:
     build_configurations: Dict[str, Dict[str, Any]]
 
 
+# project.pbxproj 骨架模板（XCBuildConfiguration 段之前 / 之后），占位符为各对象UUID、
+# {framework_name} 以及按文件生成的动态片段
+TEMPLATE_PBXPROJ_HEAD = '''// !$*UTF8*$!
+{{
+\tarchiveVersion = 1;
+\tclasses = {{
+\t}};
+\tobjectVersion = 56;
+\tobjects = {{
+
+/* Begin PBXBuildFile section */
+{build_file_section}/* End PBXBuildFile section */
+
+/* Begin PBXFileReference section */
+\t\t{product_ref_uuid} /* {framework_name}.framework */ = {{isa = PBXFileReference; explicitFileType = wrapper.framework; includeInIndex = 0; path = {framework_name}.framework; sourceTree = BUILT_PRODUCTS_DIR; }};
+{file_reference_section}/* End PBXFileReference section */
+
+/* Begin PBXFrameworksBuildPhase section */
+\t\t{frameworks_phase_uuid} /* Frameworks */ = {{
+\t\t\tisa = PBXFrameworksBuildPhase;
+\t\t\tbuildActionMask = 2147483647;
+\t\t\tfiles = (
+\t\t\t);
+\t\t\trunOnlyForDeploymentPostprocessing = 0;
+\t\t}};
+/* End PBXFrameworksBuildPhase section */
+
+/* Begin PBXGroup section */
+\t\t{main_group_uuid} = {{
+\t\t\tisa = PBXGroup;
+\t\t\tchildren = (
+\t\t\t\t{framework_group_uuid} /* {framework_name} */,
+\t\t\t\t{products_group_uuid} /* Products */,
+\t\t\t);
+\t\t\tsourceTree = "<group>";
+\t\t}};
+\t\t{products_group_uuid} /* Products */ = {{
+\t\t\tisa = PBXGroup;
+\t\t\tchildren = (
+\t\t\t\t{product_ref_uuid} /* {framework_name}.framework */,
+\t\t\t);
+\t\t\tname = Products;
+\t\t\tsourceTree = "<group>";
+\t\t}};
+\t\t{framework_group_uuid} /* {framework_name} */ = {{
+\t\t\tisa = PBXGroup;
+\t\t\tchildren = (
+{group_children}\t\t\t);
+\t\t\tpath = {framework_name};
+\t\t\tsourceTree = "<group>";
+\t\t}};
+/* End PBXGroup section */
+
+/* Begin PBXHeadersBuildPhase section */
+\t\t{headers_phase_uuid} /* Headers */ = {{
+\t\t\tisa = PBXHeadersBuildPhase;
+\t\t\tbuildActionMask = 2147483647;
+\t\t\tfiles = (
+{headers_phase_files}\t\t\t);
+\t\t\trunOnlyForDeploymentPostprocessing = 0;
+\t\t}};
+/* End PBXHeadersBuildPhase section */
+
+/* Begin PBXNativeTarget section */
+\t\t{target_uuid} /* {framework_name} */ = {{
+\t\t\tisa = PBXNativeTarget;
+\t\t\tbuildConfigurationList = {target_config_list_uuid} /* Build configuration list for PBXNativeTarget "{framework_name}" */;
+\t\t\tbuildPhases = (
+\t\t\t\t{headers_phase_uuid} /* Headers */,
+\t\t\t\t{sources_phase_uuid} /* Sources */,
+\t\t\t\t{frameworks_phase_uuid} /* Frameworks */,
+\t\t\t);
+\t\t\tbuildRules = (
+\t\t\t);
+\t\t\tdependencies = (
+\t\t\t);
+\t\t\tname = {framework_name};
+\t\t\tproductName = {framework_name};
+\t\t\tproductReference = {product_ref_uuid} /* {framework_name}.framework */;
+\t\t\tproductType = "com.apple.product-type.framework";
+\t\t}};
+/* End PBXNativeTarget section */
+
+/* Begin PBXProject section */
+\t\t{project_uuid} /* Project object */ = {{
+\t\t\tisa = PBXProject;
+\t\t\tattributes = {{
+\t\t\t\tBuildIndependentTargetsInParallel = 1;
+\t\t\t\tLastUpgradeCheck = 1500;
+\t\t\t\tTargetAttributes = {{
+\t\t\t\t\t{target_uuid} = {{
+\t\t\t\t\t\tCreatedOnToolsVersion = 15.0;
+\t\t\t\t\t}};
+\t\t\t\t}};
+\t\t\t}};
+\t\t\tbuildConfigurationList = {project_config_list_uuid} /* Build configuration list for PBXProject "{framework_name}" */;
+\t\t\tcompatibilityVersion = "Xcode 14.0";
+\t\t\tdevelopmentRegion = en;
+\t\t\thasScannedForEncodings = 0;
+\t\t\tknownRegions = (
+\t\t\t\ten,
+\t\t\t\tBase,
+\t\t\t);
+\t\t\tmainGroup = {main_group_uuid};
+\t\t\tproductRefGroup = {products_group_uuid} /* Products */;
+\t\t\tprojectDirPath = "";
+\t\t\tprojectRoot = "";
+\t\t\ttargets = (
+\t\t\t\t{target_uuid} /* {framework_name} */,
+\t\t\t);
+\t\t}};
+/* End PBXProject section */
+
+/* Begin PBXSourcesBuildPhase section */
+\t\t{sources_phase_uuid} /* Sources */ = {{
+\t\t\tisa = PBXSourcesBuildPhase;
+\t\t\tbuildActionMask = 2147483647;
+\t\t\tfiles = (
+{sources_phase_files}\t\t\t);
+\t\t\trunOnlyForDeploymentPostprocessing = 0;
+\t\t}};
+/* End PBXSourcesBuildPhase section */
+
+/* Begin XCBuildConfiguration section */
+'''
+
+TEMPLATE_PBXPROJ_TAIL = '''/* End XCBuildConfiguration section */
+
+/* Begin XCConfigurationList section */
+\t\t{project_config_list_uuid} /* Build configuration list for PBXProject "{framework_name}" */ = {{
+\t\t\tisa = XCConfigurationList;
+\t\t\tbuildConfigurations = (
+\t\t\t\t{project_debug_uuid} /* Debug */,
+\t\t\t\t{project_release_uuid} /* Release */,
+\t\t\t);
+\t\t\tdefaultConfigurationIsVisible = 0;
+\t\t\tdefaultConfigurationName = Release;
+\t\t}};
+\t\t{target_config_list_uuid} /* Build configuration list for PBXNativeTarget "{framework_name}" */ = {{
+\t\t\tisa = XCConfigurationList;
+\t\t\tbuildConfigurations = (
+\t\t\t\t{target_debug_uuid} /* Debug */,
+\t\t\t\t{target_release_uuid} /* Release */,
+\t\t\t);
+\t\t\tdefaultConfigurationIsVisible = 0;
+\t\t\tdefaultConfigurationName = Release;
+\t\t}};
+/* End XCConfigurationList section */
+\t}};
+\trootObject = {project_uuid} /* Project object */;
+}}
+'''
+
+# 按文件生成的 pbxproj 行模板，占位符: {name}、{uid}（文件引用UUID）、{buid}（构建文件UUID）
+LINE_HEADER_BUILD_FILE = '\t\t{buid} /* {name} in Headers */ = {{isa = PBXBuildFile; fileRef = {uid} /* {name} */; settings = {{ATTRIBUTES = (Public, ); }}; }};\n'
+LINE_SOURCE_BUILD_FILE = '\t\t{buid} /* {name} in Sources */ = {{isa = PBXBuildFile; fileRef = {uid} /* {name} */; }};\n'
+LINE_HEADER_FILE_REFERENCE = '\t\t{uid} /* {name} */ = {{isa = PBXFileReference; lastKnownFileType = sourcecode.c.h; path = {name}; sourceTree = "<group>"; }};\n'
+LINE_SOURCE_FILE_REFERENCE = '\t\t{uid} /* {name} */ = {{isa = PBXFileReference; lastKnownFileType = sourcecode.c.objc; path = {name}; sourceTree = "<group>"; }};\n'
+LINE_GROUP_CHILD = '\t\t\t\t{uid} /* {name} */,\n'
+LINE_HEADERS_PHASE_FILE = '\t\t\t\t{buid} /* {name} in Headers */,\n'
+LINE_SOURCES_PHASE_FILE = '\t\t\t\t{buid} /* {name} in Sources */,\n'
+
+# 参与项目缓存键计算的全部行模板（修改任一模板都会使已生成的项目失效）
+_PBXPROJ_LINE_TEMPLATES = (
+    LINE_HEADER_BUILD_FILE, LINE_SOURCE_BUILD_FILE,
+    LINE_HEADER_FILE_REFERENCE, LINE_SOURCE_FILE_REFERENCE,
+    LINE_GROUP_CHILD, LINE_HEADERS_PHASE_FILE, LINE_SOURCES_PHASE_FILE,
+)
+
+# XCBuildConfiguration 模板，占位符: {uuid}、{framework_name}、{info_plist_path}
+TEMPLATE_PROJECT_DEBUG = '''\t\t{uuid} /* Debug */ = {{
+\t\t\tisa = XCBuildConfiguration;
+\t\t\tbuildSettings = {{
+\t\t\t\tINFOPLIST_FILE = "{info_plist_path}";
+\t\t\t\tALWAYS_SEARCH_USER_PATHS = NO;
+\t\t\t\tBUILD_LIBRARY_FOR_DISTRIBUTION = YES;
+\t\t\t\tCLANG_ANALYZER_NONNULL = YES;
+\t\t\t\tCLANG_ANALYZER_NUMBER_OBJECT_CONVERSION = YES_AGGRESSIVE;
+\t\t\t\tCLANG_CXX_LANGUAGE_STANDARD = "gnu++20";
+\t\t\t\tCLANG_ENABLE_MODULES = YES;
+\t\t\t\tCLANG_ENABLE_OBJC_ARC = YES;
+\t\t\t\tCLANG_ENABLE_OBJC_WEAK = YES;
+\t\t\t\tCLANG_WARN_BLOCK_CAPTURE_AUTORELEASING = YES;
+\t\t\t\tCLANG_WARN_BOOL_CONVERSION = YES;
+\t\t\t\tCLANG_WARN_COMMA = YES;
+\t\t\t\tCLANG_WARN_CONSTANT_CONVERSION = YES;
+\t\t\t\tCLANG_WARN_DEPRECATED_OBJC_IMPLEMENTATIONS = YES;
+\t\t\t\tCLANG_WARN_DIRECT_OBJC_ISA_USAGE = YES_ERROR;
+\t\t\t\tCLANG_WARN_DOCUMENTATION_COMMENTS = YES;
+\t\t\t\tCLANG_WARN_EMPTY_BODY = YES;
+\t\t\t\tCLANG_WARN_ENUM_CONVERSION = YES;
+\t\t\t\tCLANG_WARN_INFINITE_RECURSION = YES;
+\t\t\t\tCLANG_WARN_INT_CONVERSION = YES;
+\t\t\t\tCLANG_WARN_NON_LITERAL_NULL_CONVERSION = YES;
+\t\t\t\tCLANG_WARN_OBJC_IMPLICIT_RETAIN_SELF = YES;
+\t\t\t\tCLANG_WARN_OBJC_LITERAL_CONVERSION = YES;
+\t\t\t\tCLANG_WARN_OBJC_ROOT_CLASS = YES_ERROR;
+\t\t\t\tCLANG_WARN_QUOTED_INCLUDE_IN_FRAMEWORK_HEADER = YES;
+\t\t\t\tCLANG_WARN_RANGE_LOOP_ANALYSIS = YES;
+\t\t\t\tCLANG_WARN_STRICT_PROTOTYPES = YES;
+\t\t\t\tCLANG_WARN_SUSPICIOUS_MOVE = YES;
+\t\t\t\tCLANG_WARN_UNGUARDED_AVAILABILITY = YES_AGGRESSIVE;
+\t\t\t\tCLANG_WARN_UNREACHABLE_CODE = YES;
+\t\t\t\tCLANG_WARN__DUPLICATE_METHOD_MATCH = YES;
+\t\t\t\tCOPY_PHASE_STRIP = NO;
+\t\t\t\tDEBUG_INFORMATION_FORMAT = dwarf;
+\t\t\t\tENABLE_STRICT_OBJC_MSGSEND = YES;
+\t\t\t\tENABLE_TESTABILITY = YES;
+\t\t\t\tGCC_C_LANGUAGE_STANDARD = gnu11;
+\t\t\t\tGCC_DYNAMIC_NO_PIC = NO;
+\t\t\t\tGCC_NO_COMMON_BLOCKS = YES;
+\t\t\t\tGCC_OPTIMIZATION_LEVEL = 0;
+\t\t\t\tGCC_PREPROCESSOR_DEFINITIONS = (
+\t\t\t\t\t"DEBUG=1",
+\t\t\t\t\t"$(inherited)",
+\t\t\t\t);
+\t\t\t\tGCC_WARN_64_TO_32_BIT_CONVERSION = YES;
+\t\t\t\tGCC_WARN_ABOUT_RETURN_TYPE = YES_ERROR;
+\t\t\t\tGCC_WARN_UNDECLARED_SELECTOR = YES;
+\t\t\t\tGCC_WARN_UNINITIALIZED_AUTOS = YES_AGGRESSIVE;
+\t\t\t\tGCC_WARN_UNUSED_FUNCTION = YES;
+\t\t\t\tGCC_WARN_UNUSED_VARIABLE = YES;
+\t\t\t\tIPHONEOS_DEPLOYMENT_TARGET = 12.0;
+\t\t\t\tMTL_ENABLE_DEBUG_INFO = INCLUDE_SOURCE;
+\t\t\t\tMTL_FAST_MATH = YES;
+\t\t\t\tONLY_ACTIVE_ARCH = YES;
+\t\t\t\tSDKROOT = iphoneos;
+\t\t\t\tSKIP_INSTALL = NO;
+\t\t\t}};
+\t\t\tname = Debug;
+\t\t}};
+'''
+
+TEMPLATE_PROJECT_RELEASE = '''\t\t{uuid} /* Release */ = {{
+\t\t\tisa = XCBuildConfiguration;
+\t\t\tbuildSettings = {{
+\t\t\t\tINFOPLIST_FILE = "{info_plist_path}";
+\t\t\t\tALWAYS_SEARCH_USER_PATHS = NO;
+\t\t\t\tBUILD_LIBRARY_FOR_DISTRIBUTION = YES;
+\t\t\t\tCLANG_ANALYZER_NONNULL = YES;
+\t\t\t\tCLANG_ANALYZER_NUMBER_OBJECT_CONVERSION = YES_AGGRESSIVE;
+\t\t\t\tCLANG_CXX_LANGUAGE_STANDARD = "gnu++20";
+\t\t\t\tCLANG_ENABLE_MODULES = YES;
+\t\t\t\tCLANG_ENABLE_OBJC_ARC = YES;
+\t\t\t\tCLANG_ENABLE_OBJC_WEAK = YES;
+\t\t\t\tCLANG_WARN_BLOCK_CAPTURE_AUTORELEASING = YES;
+\t\t\t\tCLANG_WARN_BOOL_CONVERSION = YES;
+\t\t\t\tCLANG_WARN_COMMA = YES;
+\t\t\t\tCLANG_WARN_CONSTANT_CONVERSION = YES;
+\t\t\t\tCLANG_WARN_DEPRECATED_OBJC_IMPLEMENTATIONS = YES;
+\t\t\t\tCLANG_WARN_DIRECT_OBJC_ISA_USAGE = YES_ERROR;
+\t\t\t\tCLANG_WARN_DOCUMENTATION_COMMENTS = YES;
+\t\t\t\tCLANG_WARN_EMPTY_BODY = YES;
+\t\t\t\tCLANG_WARN_ENUM_CONVERSION = YES;
+\t\t\t\tCLANG_WARN_INFINITE_RECURSION = YES;
+\t\t\t\tCLANG_WARN_INT_CONVERSION = YES;
+\t\t\t\tCLANG_WARN_NON_LITERAL_NULL_CONVERSION = YES;
+\t\t\t\tCLANG_WARN_OBJC_IMPLICIT_RETAIN_SELF = YES;
+\t\t\t\tCLANG_WARN_OBJC_LITERAL_CONVERSION = YES;
+\t\t\t\tCLANG_WARN_OBJC_ROOT_CLASS = YES_ERROR;
+\t\t\t\tCLANG_WARN_QUOTED_INCLUDE_IN_FRAMEWORK_HEADER = YES;
+\t\t\t\tCLANG_WARN_RANGE_LOOP_ANALYSIS = YES;
+\t\t\t\tCLANG_WARN_STRICT_PROTOTYPES = YES;
+\t\t\t\tCLANG_WARN_SUSPICIOUS_MOVE = YES;
+\t\t\t\tCLANG_WARN_UNGUARDED_AVAILABILITY = YES_AGGRESSIVE;
+\t\t\t\tCLANG_WARN_UNREACHABLE_CODE = YES;
+\t\t\t\tCLANG_WARN__DUPLICATE_METHOD_MATCH = YES;
+\t\t\t\tCOPY_PHASE_STRIP = NO;
+\t\t\t\tDEBUG_INFORMATION_FORMAT = "dwarf-with-dsym";
+\t\t\t\tENABLE_NS_ASSERTIONS = NO;
+\t\t\t\tENABLE_STRICT_OBJC_MSGSEND = YES;
+\t\t\t\tGCC_C_LANGUAGE_STANDARD = gnu11;
+\t\t\t\tGCC_NO_COMMON_BLOCKS = YES;
+\t\t\t\tGCC_WARN_64_TO_32_BIT_CONVERSION = YES;
+\t\t\t\tGCC_WARN_ABOUT_RETURN_TYPE = YES_ERROR;
+\t\t\t\tGCC_WARN_UNDECLARED_SELECTOR = YES;
+\t\t\t\tGCC_WARN_UNINITIALIZED_AUTOS = YES_AGGRESSIVE;
+\t\t\t\tGCC_WARN_UNUSED_FUNCTION = YES;
+\t\t\t\tGCC_WARN_UNUSED_VARIABLE = YES;
+\t\t\t\tIPHONEOS_DEPLOYMENT_TARGET = 12.0;
+\t\t\t\tMTL_ENABLE_DEBUG_INFO = NO;
+\t\t\t\tMTL_FAST_MATH = YES;
+\t\t\t\tSDKROOT = iphoneos;
+\t\t\t\tSKIP_INSTALL = NO;
+\t\t\t\tVALIDATE_PRODUCT = YES;
+\t\t\t}};
+\t\t\tname = Release;
+\t\t}};
+'''
+
+TEMPLATE_TARGET_DEBUG = '''\t\t{uuid} /* Debug */ = {{
+\t\t\tisa = XCBuildConfiguration;
+\t\t\tbuildSettings = {{
+\t\t\t\tINFOPLIST_FILE = "{info_plist_path}";
+\t\t\t\tCODE_SIGN_STYLE = Automatic;
+\t\t\t\tCURRENT_PROJECT_VERSION = 1;
+\t\t\t\tDEFINES_MODULE = YES;
+\t\t\t\tDYLIB_COMPATIBILITY_VERSION = 1;
+\t\t\t\tDYLIB_CURRENT_VERSION = 1;
+\t\t\t\tDYLIB_INSTALL_NAME_BASE = "@rpath";
+\t\t\t\tINFOPLIST_KEY_NSHumanReadableCopyright = "";
+\t\t\t\tINSTALL_PATH = "$(LOCAL_LIBRARY_DIR)/Frameworks";
+\t\t\t\tLD_RUNPATH_SEARCH_PATHS = (
+\t\t\t\t\t"$(inherited)",
+\t\t\t\t\t"@executable_path/Frameworks",
+\t\t\t\t\t"@loader_path/Frameworks",
+\t\t\t\t);
+\t\t\t\tMARKETING_VERSION = 1.0;
+\t\t\t\tPRODUCT_BUNDLE_IDENTIFIER = "com.example.{framework_name}";
+\t\t\t\tPRODUCT_NAME = "$(TARGET_NAME:c99extidentifier)";
+\t\t\t\tSKIP_INSTALL = YES;
+\t\t\t\tSWIFT_EMIT_LOC_STRINGS = YES;
+\t\t\t\tTARGETED_DEVICE_FAMILY = "1,2";
+\t\t\t\tVERSIONING_SYSTEM = "apple-generic";
+\t\t\t}};
+\t\t\tname = Debug;
+\t\t}};
+'''
+
+TEMPLATE_TARGET_RELEASE = '''\t\t{uuid} /* Release */ = {{
+\t\t\tisa = XCBuildConfiguration;
+\t\t\tbuildSettings = {{
+\t\t\t\tINFOPLIST_FILE = "{info_plist_path}";
+\t\t\t\tCODE_SIGN_STYLE = Automatic;
+\t\t\t\tCURRENT_PROJECT_VERSION = 1;
+\t\t\t\tDEFINES_MODULE = YES;
+\t\t\t\tDYLIB_COMPATIBILITY_VERSION = 1;
+\t\t\t\tDYLIB_CURRENT_VERSION = 1;
+\t\t\t\tDYLIB_INSTALL_NAME_BASE = "@rpath";
+\t\t\t\tINFOPLIST_KEY_NSHumanReadableCopyright = "";
+\t\t\t\tINSTALL_PATH = "$(LOCAL_LIBRARY_DIR)/Frameworks";
+\t\t\t\tLD_RUNPATH_SEARCH_PATHS = (
+\t\t\t\t\t"$(inherited)",
+\t\t\t\t\t"@executable_path/Frameworks",
+\t\t\t\t\t"@loader_path/Frameworks",
+\t\t\t\t);
+\t\t\t\tMARKETING_VERSION = 1.0;
+\t\t\t\tPRODUCT_BUNDLE_IDENTIFIER = "com.example.{framework_name}";
+\t\t\t\tPRODUCT_NAME = "$(TARGET_NAME:c99extidentifier)";
+\t\t\t\tSKIP_INSTALL = YES;
+\t\t\t\tSWIFT_EMIT_LOC_STRINGS = YES;
+\t\t\t\tTARGETED_DEVICE_FAMILY = "1,2";
+\t\t\t\tVERSIONING_SYSTEM = "apple-generic";
+\t\t\t}};
+\t\t\tname = Release;
+\t\t}};
+'''
+
+
+# xcscheme / xcworkspacedata 模板，占位符: {framework_name}、{blueprint_uuid}
+SCHEME_TEMPLATE = '''<?xml version="1.0" encoding="UTF-8"?>
+<Scheme
+   LastUpgradeVersion = "1500"
+   version = "1.3">
+   <BuildAction
+      parallelizeBuildables = "YES"
+      buildImplicitDependencies = "YES">
+      <BuildActionEntries>
+         <BuildActionEntry
+            buildForTesting = "YES"
+            buildForRunning = "YES"
+            buildForProfiling = "YES"
+            buildForArchiving = "YES"
+            buildForAnalyzing = "YES">
+            <BuildableReference
+               BuildableIdentifier = "primary"
+               BlueprintIdentifier = "{blueprint_uuid}"
+               BuildableName = "{framework_name}.framework"
+               BlueprintName = "{framework_name}"
+               ReferencedContainer = "container:{framework_name}.xcodeproj">
+            </BuildableReference>
+         </BuildActionEntry>
+      </BuildActionEntries>
+   </BuildAction>
+   <TestAction
+      buildConfiguration = "Debug"
+      selectedDebuggerIdentifier = "Xcode.DebuggerFoundation.Debugger.LLDB"
+      selectedLauncherIdentifier = "Xcode.DebuggerFoundation.Launcher.LLDB"
+      shouldUseLaunchSchemeArgsEnv = "YES">
+      <Testables>
+      </Testables>
+   </TestAction>
+   <LaunchAction
+      buildConfiguration = "Debug"
+      selectedDebuggerIdentifier = "Xcode.DebuggerFoundation.Debugger.LLDB"
+      selectedLauncherIdentifier = "Xcode.DebuggerFoundation.Launcher.LLDB"
+      launchStyle = "0"
+      useCustomWorkingDirectory = "NO"
+      ignoresPersistentStateOnLaunch = "NO"
+      debugDocumentVersioning = "YES"
+      debugServiceExtension = "internal"
+      allowLocationSimulation = "YES">
+   </LaunchAction>
+   <ProfileAction
+      buildConfiguration = "Release"
+      shouldUseLaunchSchemeArgsEnv = "YES"
+      savedToolIdentifier = ""
+      useCustomWorkingDirectory = "NO"
+      debugDocumentVersioning = "YES">
+   </ProfileAction>
+   <AnalyzeAction
+      buildConfiguration = "Debug">
+   </AnalyzeAction>
+   <ArchiveAction
+      buildConfiguration = "Release"
+      revealArchiveInOrganizer = "YES">
+   </ArchiveAction>
+</Scheme>'''
+
+WORKSPACE_TEMPLATE = '''<?xml version="1.0" encoding="UTF-8"?>
+<Workspace
+   version = "1.0">
+   <FileRef
+      location = "self:{framework_name}.xcodeproj">
+   </FileRef>
+</Workspace>'''
+
+
+# 仓库 src 目录（字符串形式，热路径上直接用 os.path.join 拼接）
+_SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+
+@functools.lru_cache(maxsize=None)
+def _info_plist_source(project_name: str) -> str:
+    """src 下 Info.plist 的路径（只缓存路径，是否存在每次调用时检查）"""
+    return os.path.join(_SRC_DIR, project_name, 'Info.plist')
+
+
+def _write_bytes(path, data: bytes):
+    """用 os.write 直接写入已编码的内容，绕过文本/缓冲 IO 层"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _generate_uuid_batch(n: int) -> List[str]:
+    """批量生成 n 个24位UUID（Xcode格式），只调用一次 os.urandom"""
+    raw = os.urandom(12 * n)
+    return [raw[i:i + 12].hex().upper() for i in range(0, 12 * n, 12)]
+
+
+# 资源目录中不会有需要编译的源文件，遍历时整棵子树跳过
+_RESOURCE_DIR_SUFFIXES = ('.xcassets', '.bundle')
+
+
+def _scan_files(path: str, suffix: str):
+    """递归遍历目录，逐个产出指定后缀（两个字符，如 '.m'）的文件名（不进入符号链接目录和资源目录）"""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            name = entry.name
+            # 先按文件名筛选，只有命中后缀的条目才需要判断是否为文件
+            if name[-2:] == suffix and entry.is_file():
+                yield name
+            elif entry.is_dir(follow_symlinks=False) and not name.endswith(_RESOURCE_DIR_SUFFIXES):
+                yield from _scan_files(entry.path, suffix)
+
+
 class XcodeProjectGenerator:
     """Xcode项目生成器"""
     
     def __init__(self):
-        pass
+        # 整个 pbxproj 骨架只在初始化时拼装一次，每个项目只做一次 format_map
+        self._pbxproj_skeleton = "".join([
+            TEMPLATE_PBXPROJ_HEAD,
+            TEMPLATE_PROJECT_DEBUG.replace('{uuid}', '{project_debug_uuid}'),
+            TEMPLATE_PROJECT_RELEASE.replace('{uuid}', '{project_release_uuid}'),
+            TEMPLATE_TARGET_DEBUG.replace('{uuid}', '{target_debug_uuid}'),
+            TEMPLATE_TARGET_RELEASE.replace('{uuid}', '{target_release_uuid}'),
+            TEMPLATE_PBXPROJ_TAIL,
+        ])
     
     def generate_project(self, config: Dict[str, Any], output_dir: str) -> bool:
         """生成Xcode项目"""
@@ -46,10 +518,9 @@ class XcodeProjectGenerator:
             project_dir.mkdir(parents=True, exist_ok=True)
             
             # 自动复制 Info.plist
-            src_info_plist = Path(__file__).parent.parent / 'src' / project_name / 'Info.plist'
-            dst_info_plist = Path(output_dir) / 'Info.plist'
-            if src_info_plist.exists():
-                import shutil
+            src_info_plist = _info_plist_source(project_name)
+            dst_info_plist = os.path.join(output_dir, 'Info.plist')
+            if os.path.exists(src_info_plist):
                 shutil.copy2(src_info_plist, dst_info_plist)
                 print(f"✅ 已复制 Info.plist 到 {dst_info_plist}")
             else:
@@ -60,10 +531,17 @@ class XcodeProjectGenerator:
             # 查找源文件
             source_files = self._find_source_files(output_dir, project_name)
             
-            # 写入project.pbxproj文件
+            # 输入（配置、文件列表、模板）未变化且项目文件齐全时直接跳过
             pbxproj_path = project_dir / "project.pbxproj"
-            with open(pbxproj_path, 'w', encoding='utf-8') as f:
-                self._write_pbxproj_template(f, project_name, source_files, config.get('info_plist_path'))
+            cache_key = self._project_cache_key(config, source_files)
+            key_path = project_dir / ".cache" / "pbxproj.key"
+            if self._is_project_up_to_date(project_dir, key_path, cache_key):
+                print(f"⏭️ Xcode项目未变化，跳过生成: {project_dir}")
+                return True
+            
+            # 写入project.pbxproj文件
+            pbxproj_content = self._render_pbxproj_template(project_name, source_files, config.get('info_plist_path'))
+            _write_bytes(pbxproj_path, pbxproj_content.encode('utf-8'))
             
             # 生成xcscheme文件
             self._generate_schemes(project_dir, config)
@@ -71,6 +549,12 @@ class XcodeProjectGenerator:
             # 生成xcworkspacedata文件
             self._generate_workspace_data(project_dir, config)
             
+            # 全部写完后再记录输入哈希，先写临时文件再原子替换
+            key_path.parent.mkdir(exist_ok=True)
+            tmp_key_path = key_path.with_name(key_path.name + '.tmp')
+            _write_bytes(tmp_key_path, cache_key.encode('ascii'))
+            os.replace(tmp_key_path, key_path)
+            
             print(f"✅ Xcode项目生成完成: {project_dir}")
             return True
             
@@ -78,430 +562,139 @@ class XcodeProjectGenerator:
             print(f"❌ 生成Xcode项目失败: {e}")
             return False
     
-    def _find_source_files(self, output_dir: str, framework_name: str) -> Dict[str, List[Path]]:
-        """查找源文件"""
-        framework_dir = Path(output_dir) / framework_name
+    def generate_projects(self, configs: List[Dict[str, Any]], output_dir: str, workers: Optional[int] = None) -> List[bool]:
+        """批量生成多个Xcode项目，默认在当前进程中依次生成。
+        
+        单个项目的生成不到一毫秒且以IO为主，而 spawn 方式启动每个子进程就要上百毫秒，
+        因此只有调用方显式传入 workers > 1 时才使用多进程（调用方需有 __main__ 保护）。
+        """
+        if workers is None or workers <= 1 or len(configs) <= 1:
+            return [self.generate_project(config, output_dir) for config in configs]
+        
+        workers = min(workers, len(configs))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_generate_one, configs, [output_dir] * len(configs)))
+    
+    def _project_cache_key(self, config: Dict[str, Any], source_files: Dict[str, List[str]]) -> str:
+        """根据配置、源文件名以及 pbxproj（骨架与按文件的行模板）/ scheme / workspace 模板计算输入哈希"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(json.dumps(config, sort_keys=True, default=str).encode('utf-8'))
+        for kind in ('headers', 'sources'):
+            digest.update(b'\0' + kind.encode('ascii'))
+            for name in sorted(set(source_files[kind])):
+                digest.update(b'\0' + name.encode('utf-8'))
+        for template in (self._pbxproj_skeleton, *_PBXPROJ_LINE_TEMPLATES, SCHEME_TEMPLATE, WORKSPACE_TEMPLATE):
+            digest.update(b'\0' + template.encode('utf-8'))
+        return digest.hexdigest()
+    
+    def _is_project_up_to_date(self, project_dir: Path, key_path: Path, cache_key: str) -> bool:
+        """缓存的输入哈希一致且生成的文件都还在时返回 True"""
+        try:
+            with open(key_path, 'r', encoding='ascii') as f:
+                if f.read() != cache_key:
+                    return False
+        except (OSError, UnicodeDecodeError):
+            return False
+        
+        framework_name = project_dir.name[:-len('.xcodeproj')]
+        return all(os.path.exists(path) for path in (
+            project_dir / "project.pbxproj",
+            project_dir / "xcshareddata" / "xcschemes" / f"{framework_name}.xcscheme",
+            project_dir / "project.xcworkspace" / "contents.xcworkspacedata",
+        ))
+    
+    def _find_source_files(self, output_dir: str, framework_name: str) -> Dict[str, List[str]]:
+        """查找源文件，返回文件名列表（头文件只取顶层，源文件递归查找）"""
+        framework_dir = os.path.join(output_dir, framework_name)
         
         source_files = {
             'headers': [],
             'sources': []
         }
         
-        if framework_dir.exists():
-            # 查找头文件
-            for header_file in framework_dir.glob("*.h"):
-                source_files['headers'].append(header_file)
-            
-            # 查找源文件
-            for source_file in framework_dir.glob("*.m"):
-                source_files['sources'].append(source_file)
-            
-            # 递归查找子目录中的源文件
-            for subdir in framework_dir.iterdir():
-                if subdir.is_dir():
-                    for source_file in subdir.rglob("*.m"):
-                        source_files['sources'].append(source_file)
+        if os.path.isdir(framework_dir):
+            nested_sources = []
+            with os.scandir(framework_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    ext = name[-2:]
+                    if (ext == '.h' or ext == '.m') and entry.is_file():
+                        source_files['headers' if ext == '.h' else 'sources'].append(name)
+                    elif entry.is_dir() and not name.endswith(_RESOURCE_DIR_SUFFIXES):
+                        # 递归查找子目录中的源文件
+                        nested_sources.extend(_scan_files(entry.path, '.m'))
+            source_files['sources'].extend(nested_sources)
         
         print(f"📄 找到头文件: {len(source_files['headers'])} 个")
         print(f"📄 找到源文件: {len(source_files['sources'])} 个")
         
         return source_files
     
-    def _write_pbxproj_template(self, file, framework_name: str, source_files: Dict[str, List[Path]], info_plist_path: str = None):
-        """使用模板写入pbxproj文件"""
-        
-        # 生成UUID
-        project_uuid = self._generate_uuid()
-        target_uuid = self._generate_uuid()
-        main_group_uuid = self._generate_uuid()
-        framework_group_uuid = self._generate_uuid()
-        products_group_uuid = self._generate_uuid()
-        product_ref_uuid = self._generate_uuid()
-        headers_phase_uuid = self._generate_uuid()
-        sources_phase_uuid = self._generate_uuid()
-        frameworks_phase_uuid = self._generate_uuid()
-        project_config_list_uuid = self._generate_uuid()
-        target_config_list_uuid = self._generate_uuid()
-        project_debug_uuid = self._generate_uuid()
-        project_release_uuid = self._generate_uuid()
-        target_debug_uuid = self._generate_uuid()
-        target_release_uuid = self._generate_uuid()
-        
-        # 为每个文件生成UUID
-        header_uuids = {}
-        source_uuids = {}
-        header_build_uuids = {}
-        source_build_uuids = {}
-        
-        for header in source_files['headers']:
-            header_uuids[header.name] = self._generate_uuid()
-            header_build_uuids[header.name] = self._generate_uuid()
-        
-        for source in source_files['sources']:
-            source_uuids[source.name] = self._generate_uuid()
-            source_build_uuids[source.name] = self._generate_uuid()
-        
-        # 写入文件头
-        file.write("// !$*UTF8*$!\n")
-        file.write("{\n")
-        file.write("\tarchiveVersion = 1;\n")
-        file.write("\tclasses = {\n\t};\n")
-        file.write("\tobjectVersion = 56;\n")
-        file.write("\tobjects = {\n")
-        
-        # PBXBuildFile section
-        file.write("\n/* Begin PBXBuildFile section */\n")
-        for header_name, build_uuid in header_build_uuids.items():
-            file_uuid = header_uuids[header_name]
-            file.write(f"\t\t{build_uuid} /* {header_name} in Headers */ = {{isa = PBXBuildFile; fileRef = {file_uuid} /* {header_name} */; settings = {{ATTRIBUTES = (Public, ); }}; }};\n")
-        
-        for source_name, build_uuid in source_build_uuids.items():
-            file_uuid = source_uuids[source_name]
-            file.write(f"\t\t{build_uuid} /* {source_name} in Sources */ = {{isa = PBXBuildFile; fileRef = {file_uuid} /* {source_name} */; }};\n")
-        file.write("/* End PBXBuildFile section */\n")
-        
-        # PBXFileReference section
-        file.write("\n/* Begin PBXFileReference section */\n")
-        file.write(f"\t\t{product_ref_uuid} /* {framework_name}.framework */ = {{isa = PBXFileReference; explicitFileType = wrapper.framework; includeInIndex = 0; path = {framework_name}.framework; sourceTree = BUILT_PRODUCTS_DIR; }};\n")
-        
-        for header_name, file_uuid in header_uuids.items():
-            file.write(f"\t\t{file_uuid} /* {header_name} */ = {{isa = PBXFileReference; lastKnownFileType = sourcecode.c.h; path = {header_name}; sourceTree = \"<group>\"; }};\n")
-        
-        for source_name, file_uuid in source_uuids.items():
-            file.write(f"\t\t{file_uuid} /* {source_name} */ = {{isa = PBXFileReference; lastKnownFileType = sourcecode.c.objc; path = {source_name}; sourceTree = \"<group>\"; }};\n")
-        file.write("/* End PBXFileReference section */\n")
-        
-        # PBXFrameworksBuildPhase section
-        file.write("\n/* Begin PBXFrameworksBuildPhase section */\n")
-        file.write(f"\t\t{frameworks_phase_uuid} /* Frameworks */ = {{\n")
-        file.write("\t\t\tisa = PBXFrameworksBuildPhase;\n")
-        file.write("\t\t\tbuildActionMask = 2147483647;\n")
-        file.write("\t\t\tfiles = (\n")
-        file.write("\t\t\t);\n")
-        file.write("\t\t\trunOnlyForDeploymentPostprocessing = 0;\n")
-        file.write("\t\t};\n")
-        file.write("/* End PBXFrameworksBuildPhase section */\n")
-        
-        # PBXGroup section
-        file.write("\n/* Begin PBXGroup section */\n")
-        file.write(f"\t\t{main_group_uuid} = {{\n")
-        file.write("\t\t\tisa = PBXGroup;\n")
-        file.write("\t\t\tchildren = (\n")
-        file.write(f"\t\t\t\t{framework_group_uuid} /* {framework_name} */,\n")
-        file.write(f"\t\t\t\t{products_group_uuid} /* Products */,\n")
-        file.write("\t\t\t);\n")
-        file.write("\t\t\tsourceTree = \"<group>\";\n")
-        file.write("\t\t};\n")
-        
-        file.write(f"\t\t{products_group_uuid} /* Products */ = {{\n")
-        file.write("\t\t\tisa = PBXGroup;\n")
-        file.write("\t\t\tchildren = (\n")
-        file.write(f"\t\t\t\t{product_ref_uuid} /* {framework_name}.framework */,\n")
-        file.write("\t\t\t);\n")
-        file.write("\t\t\tname = Products;\n")
-        file.write("\t\t\tsourceTree = \"<group>\";\n")
-        file.write("\t\t};\n")
-        
-        file.write(f"\t\t{framework_group_uuid} /* {framework_name} */ = {{\n")
-        file.write("\t\t\tisa = PBXGroup;\n")
-        file.write("\t\t\tchildren = (\n")
-        for header_name, file_uuid in header_uuids.items():
-            file.write(f"\t\t\t\t{file_uuid} /* {header_name} */,\n")
-        for source_name, file_uuid in source_uuids.items():
-            file.write(f"\t\t\t\t{file_uuid} /* {source_name} */,\n")
-        file.write("\t\t\t);\n")
-        file.write(f"\t\t\tpath = {framework_name};\n")
-        file.write("\t\t\tsourceTree = \"<group>\";\n")
-        file.write("\t\t};\n")
-        file.write("/* End PBXGroup section */\n")
-        
-        # PBXHeadersBuildPhase section
-        file.write("\n/* Begin PBXHeadersBuildPhase section */\n")
-        file.write(f"\t\t{headers_phase_uuid} /* Headers */ = {{\n")
-        file.write("\t\t\tisa = PBXHeadersBuildPhase;\n")
-        file.write("\t\t\tbuildActionMask = 2147483647;\n")
-        file.write("\t\t\tfiles = (\n")
-        for header_name, build_uuid in header_build_uuids.items():
-            file.write(f"\t\t\t\t{build_uuid} /* {header_name} in Headers */,\n")
-        file.write("\t\t\t);\n")
-        file.write("\t\t\trunOnlyForDeploymentPostprocessing = 0;\n")
-        file.write("\t\t};\n")
-        file.write("/* End PBXHeadersBuildPhase section */\n")
-        
-        # PBXNativeTarget section
-        file.write("\n/* Begin PBXNativeTarget section */\n")
-        file.write(f"\t\t{target_uuid} /* {framework_name} */ = {{\n")
-        file.write("\t\t\tisa = PBXNativeTarget;\n")
-        file.write(f"\t\t\tbuildConfigurationList = {target_config_list_uuid} /* Build configuration list for PBXNativeTarget \"{framework_name}\" */;\n")
-        file.write("\t\t\tbuildPhases = (\n")
-        file.write(f"\t\t\t\t{headers_phase_uuid} /* Headers */,\n")
-        file.write(f"\t\t\t\t{sources_phase_uuid} /* Sources */,\n")
-        file.write(f"\t\t\t\t{frameworks_phase_uuid} /* Frameworks */,\n")
-        file.write("\t\t\t);\n")
-        file.write("\t\t\tbuildRules = (\n")
-        file.write("\t\t\t);\n")
-        file.write("\t\t\tdependencies = (\n")
-        file.write("\t\t\t);\n")
-        file.write(f"\t\t\tname = {framework_name};\n")
-        file.write(f"\t\t\tproductName = {framework_name};\n")
-        file.write(f"\t\t\tproductReference = {product_ref_uuid} /* {framework_name}.framework */;\n")
-        file.write("\t\t\tproductType = \"com.apple.product-type.framework\";\n")
-        file.write("\t\t};\n")
-        file.write("/* End PBXNativeTarget section */\n")
-        
-        # PBXProject section
-        file.write("\n/* Begin PBXProject section */\n")
-        file.write(f"\t\t{project_uuid} /* Project object */ = {{\n")
-        file.write("\t\t\tisa = PBXProject;\n")
-        file.write("\t\t\tattributes = {\n")
-        file.write("\t\t\t\tBuildIndependentTargetsInParallel = 1;\n")
-        file.write("\t\t\t\tLastUpgradeCheck = 1500;\n")
-        file.write("\t\t\t\tTargetAttributes = {\n")
-        file.write(f"\t\t\t\t\t{target_uuid} = {{\n")
-        file.write("\t\t\t\t\t\tCreatedOnToolsVersion = 15.0;\n")
-        file.write("\t\t\t\t\t};\n")
-        file.write("\t\t\t\t};\n")
-        file.write("\t\t\t};\n")
-        file.write(f"\t\t\tbuildConfigurationList = {project_config_list_uuid} /* Build configuration list for PBXProject \"{framework_name}\" */;\n")
-        file.write("\t\t\tcompatibilityVersion = \"Xcode 14.0\";\n")
-        file.write("\t\t\tdevelopmentRegion = en;\n")
-        file.write("\t\t\thasScannedForEncodings = 0;\n")
-        file.write("\t\t\tknownRegions = (\n")
-        file.write("\t\t\t\ten,\n")
-        file.write("\t\t\t\tBase,\n")
-        file.write("\t\t\t);\n")
-        file.write(f"\t\t\tmainGroup = {main_group_uuid};\n")
-        file.write(f"\t\t\tproductRefGroup = {products_group_uuid} /* Products */;\n")
-        file.write("\t\t\tprojectDirPath = \"\";\n")
-        file.write("\t\t\tprojectRoot = \"\";\n")
-        file.write("\t\t\ttargets = (\n")
-        file.write(f"\t\t\t\t{target_uuid} /* {framework_name} */,\n")
-        file.write("\t\t\t);\n")
-        file.write("\t\t};\n")
-        file.write("/* End PBXProject section */\n")
-        
-        # PBXSourcesBuildPhase section
-        file.write("\n/* Begin PBXSourcesBuildPhase section */\n")
-        file.write(f"\t\t{sources_phase_uuid} /* Sources */ = {{\n")
-        file.write("\t\t\tisa = PBXSourcesBuildPhase;\n")
-        file.write("\t\t\tbuildActionMask = 2147483647;\n")
-        file.write("\t\t\tfiles = (\n")
-        for source_name, build_uuid in source_build_uuids.items():
-            file.write(f"\t\t\t\t{build_uuid} /* {source_name} in Sources */,\n")
-        file.write("\t\t\t);\n")
-        file.write("\t\t\trunOnlyForDeploymentPostprocessing = 0;\n")
-        file.write("\t\t};\n")
-        file.write("/* End PBXSourcesBuildPhase section */\n")
-        
-        # XCBuildConfiguration section
-        file.write("\n/* Begin XCBuildConfiguration section */\n")
-        
-        # Project Debug配置
-        file.write(f"\t\t{project_debug_uuid} /* Debug */ = {{\n")
-        file.write("\t\t\tisa = XCBuildConfiguration;\n")
-        file.write("\t\t\tbuildSettings = {\n")
-        file.write(f"\t\t\t\tINFOPLIST_FILE = \"{info_plist_path or '$(SRCROOT)/Info.plist'}\";\n")
-        file.write("\t\t\t\tALWAYS_SEARCH_USER_PATHS = NO;\n")
-        file.write("\t\t\t\tBUILD_LIBRARY_FOR_DISTRIBUTION = YES;\n")
-        file.write("\t\t\t\tCLANG_ANALYZER_NONNULL = YES;\n")
-        file.write("\t\t\t\tCLANG_ANALYZER_NUMBER_OBJECT_CONVERSION = YES_AGGRESSIVE;\n")
-        file.write("\t\t\t\tCLANG_CXX_LANGUAGE_STANDARD = \"gnu++20\";\n")
-        file.write("\t\t\t\tCLANG_ENABLE_MODULES = YES;\n")
-        file.write("\t\t\t\tCLANG_ENABLE_OBJC_ARC = YES;\n")
-        file.write("\t\t\t\tCLANG_ENABLE_OBJC_WEAK = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_BLOCK_CAPTURE_AUTORELEASING = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_BOOL_CONVERSION = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_COMMA = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_CONSTANT_CONVERSION = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_DEPRECATED_OBJC_IMPLEMENTATIONS = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_DIRECT_OBJC_ISA_USAGE = YES_ERROR;\n")
-        file.write("\t\t\t\tCLANG_WARN_DOCUMENTATION_COMMENTS = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_EMPTY_BODY = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_ENUM_CONVERSION = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_INFINITE_RECURSION = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_INT_CONVERSION = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_NON_LITERAL_NULL_CONVERSION = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_OBJC_IMPLICIT_RETAIN_SELF = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_OBJC_LITERAL_CONVERSION = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_OBJC_ROOT_CLASS = YES_ERROR;\n")
-        file.write("\t\t\t\tCLANG_WARN_QUOTED_INCLUDE_IN_FRAMEWORK_HEADER = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_RANGE_LOOP_ANALYSIS = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_STRICT_PROTOTYPES = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_SUSPICIOUS_MOVE = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_UNGUARDED_AVAILABILITY = YES_AGGRESSIVE;\n")
-        file.write("\t\t\t\tCLANG_WARN_UNREACHABLE_CODE = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN__DUPLICATE_METHOD_MATCH = YES;\n")
-        file.write("\t\t\t\tCOPY_PHASE_STRIP = NO;\n")
-        file.write("\t\t\t\tDEBUG_INFORMATION_FORMAT = dwarf;\n")
-        file.write("\t\t\t\tENABLE_STRICT_OBJC_MSGSEND = YES;\n")
-        file.write("\t\t\t\tENABLE_TESTABILITY = YES;\n")
-        file.write("\t\t\t\tGCC_C_LANGUAGE_STANDARD = gnu11;\n")
-        file.write("\t\t\t\tGCC_DYNAMIC_NO_PIC = NO;\n")
-        file.write("\t\t\t\tGCC_NO_COMMON_BLOCKS = YES;\n")
-        file.write("\t\t\t\tGCC_OPTIMIZATION_LEVEL = 0;\n")
-        file.write("\t\t\t\tGCC_PREPROCESSOR_DEFINITIONS = (\n")
-        file.write("\t\t\t\t\t\"DEBUG=1\",\n")
-        file.write("\t\t\t\t\t\"$(inherited)\",\n")
-        file.write("\t\t\t\t);\n")
-        file.write("\t\t\t\tGCC_WARN_64_TO_32_BIT_CONVERSION = YES;\n")
-        file.write("\t\t\t\tGCC_WARN_ABOUT_RETURN_TYPE = YES_ERROR;\n")
-        file.write("\t\t\t\tGCC_WARN_UNDECLARED_SELECTOR = YES;\n")
-        file.write("\t\t\t\tGCC_WARN_UNINITIALIZED_AUTOS = YES_AGGRESSIVE;\n")
-        file.write("\t\t\t\tGCC_WARN_UNUSED_FUNCTION = YES;\n")
-        file.write("\t\t\t\tGCC_WARN_UNUSED_VARIABLE = YES;\n")
-        file.write("\t\t\t\tIPHONEOS_DEPLOYMENT_TARGET = 12.0;\n")
-        file.write("\t\t\t\tMTL_ENABLE_DEBUG_INFO = INCLUDE_SOURCE;\n")
-        file.write("\t\t\t\tMTL_FAST_MATH = YES;\n")
-        file.write("\t\t\t\tONLY_ACTIVE_ARCH = YES;\n")
-        file.write("\t\t\t\tSDKROOT = iphoneos;\n")
-        file.write("\t\t\t\tSKIP_INSTALL = NO;\n")
-        file.write("\t\t\t};\n")
-        file.write("\t\t\tname = Debug;\n")
-        file.write("\t\t};\n")
-        
-        # Project Release配置
-        file.write(f"\t\t{project_release_uuid} /* Release */ = {{\n")
-        file.write("\t\t\tisa = XCBuildConfiguration;\n")
-        file.write("\t\t\tbuildSettings = {\n")
-        file.write(f"\t\t\t\tINFOPLIST_FILE = \"{info_plist_path or '$(SRCROOT)/Info.plist'}\";\n")
-        file.write("\t\t\t\tALWAYS_SEARCH_USER_PATHS = NO;\n")
-        file.write("\t\t\t\tBUILD_LIBRARY_FOR_DISTRIBUTION = YES;\n")
-        file.write("\t\t\t\tCLANG_ANALYZER_NONNULL = YES;\n")
-        file.write("\t\t\t\tCLANG_ANALYZER_NUMBER_OBJECT_CONVERSION = YES_AGGRESSIVE;\n")
-        file.write("\t\t\t\tCLANG_CXX_LANGUAGE_STANDARD = \"gnu++20\";\n")
-        file.write("\t\t\t\tCLANG_ENABLE_MODULES = YES;\n")
-        file.write("\t\t\t\tCLANG_ENABLE_OBJC_ARC = YES;\n")
-        file.write("\t\t\t\tCLANG_ENABLE_OBJC_WEAK = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_BLOCK_CAPTURE_AUTORELEASING = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_BOOL_CONVERSION = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_COMMA = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_CONSTANT_CONVERSION = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_DEPRECATED_OBJC_IMPLEMENTATIONS = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_DIRECT_OBJC_ISA_USAGE = YES_ERROR;\n")
-        file.write("\t\t\t\tCLANG_WARN_DOCUMENTATION_COMMENTS = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_EMPTY_BODY = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_ENUM_CONVERSION = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_INFINITE_RECURSION = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_INT_CONVERSION = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_NON_LITERAL_NULL_CONVERSION = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_OBJC_IMPLICIT_RETAIN_SELF = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_OBJC_LITERAL_CONVERSION = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_OBJC_ROOT_CLASS = YES_ERROR;\n")
-        file.write("\t\t\t\tCLANG_WARN_QUOTED_INCLUDE_IN_FRAMEWORK_HEADER = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_RANGE_LOOP_ANALYSIS = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_STRICT_PROTOTYPES = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_SUSPICIOUS_MOVE = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN_UNGUARDED_AVAILABILITY = YES_AGGRESSIVE;\n")
-        file.write("\t\t\t\tCLANG_WARN_UNREACHABLE_CODE = YES;\n")
-        file.write("\t\t\t\tCLANG_WARN__DUPLICATE_METHOD_MATCH = YES;\n")
-        file.write("\t\t\t\tCOPY_PHASE_STRIP = NO;\n")
-        file.write("\t\t\t\tDEBUG_INFORMATION_FORMAT = \"dwarf-with-dsym\";\n")
-        file.write("\t\t\t\tENABLE_NS_ASSERTIONS = NO;\n")
-        file.write("\t\t\t\tENABLE_STRICT_OBJC_MSGSEND = YES;\n")
-        file.write("\t\t\t\tGCC_C_LANGUAGE_STANDARD = gnu11;\n")
-        file.write("\t\t\t\tGCC_NO_COMMON_BLOCKS = YES;\n")
-        file.write("\t\t\t\tGCC_WARN_64_TO_32_BIT_CONVERSION = YES;\n")
-        file.write("\t\t\t\tGCC_WARN_ABOUT_RETURN_TYPE = YES_ERROR;\n")
-        file.write("\t\t\t\tGCC_WARN_UNDECLARED_SELECTOR = YES;\n")
-        file.write("\t\t\t\tGCC_WARN_UNINITIALIZED_AUTOS = YES_AGGRESSIVE;\n")
-        file.write("\t\t\t\tGCC_WARN_UNUSED_FUNCTION = YES;\n")
-        file.write("\t\t\t\tGCC_WARN_UNUSED_VARIABLE = YES;\n")
-        file.write("\t\t\t\tIPHONEOS_DEPLOYMENT_TARGET = 12.0;\n")
-        file.write("\t\t\t\tMTL_ENABLE_DEBUG_INFO = NO;\n")
-        file.write("\t\t\t\tMTL_FAST_MATH = YES;\n")
-        file.write("\t\t\t\tSDKROOT = iphoneos;\n")
-        file.write("\t\t\t\tSKIP_INSTALL = NO;\n")
-        file.write("\t\t\t\tVALIDATE_PRODUCT = YES;\n")
-        file.write("\t\t\t};\n")
-        file.write("\t\t\tname = Release;\n")
-        file.write("\t\t};\n")
-        
-        # Target Debug配置
-        file.write(f"\t\t{target_debug_uuid} /* Debug */ = {{\n")
-        file.write("\t\t\tisa = XCBuildConfiguration;\n")
-        file.write("\t\t\tbuildSettings = {\n")
-        file.write(f"\t\t\t\tINFOPLIST_FILE = \"{info_plist_path or '$(SRCROOT)/Info.plist'}\";\n")
-        file.write("\t\t\t\tCODE_SIGN_STYLE = Automatic;\n")
-        file.write("\t\t\t\tCURRENT_PROJECT_VERSION = 1;\n")
-        file.write("\t\t\t\tDEFINES_MODULE = YES;\n")
-        file.write("\t\t\t\tDYLIB_COMPATIBILITY_VERSION = 1;\n")
-        file.write("\t\t\t\tDYLIB_CURRENT_VERSION = 1;\n")
-        file.write("\t\t\t\tDYLIB_INSTALL_NAME_BASE = \"@rpath\";\n")
-        file.write("\t\t\t\tINFOPLIST_KEY_NSHumanReadableCopyright = \"\";\n")
-        file.write("\t\t\t\tINSTALL_PATH = \"$(LOCAL_LIBRARY_DIR)/Frameworks\";\n")
-        file.write("\t\t\t\tLD_RUNPATH_SEARCH_PATHS = (\n")
-        file.write("\t\t\t\t\t\"$(inherited)\",\n")
-        file.write("\t\t\t\t\t\"@executable_path/Frameworks\",\n")
-        file.write("\t\t\t\t\t\"@loader_path/Frameworks\",\n")
-        file.write("\t\t\t\t);\n")
-        file.write("\t\t\t\tMARKETING_VERSION = 1.0;\n")
-        file.write(f"\t\t\t\tPRODUCT_BUNDLE_IDENTIFIER = \"com.example.{framework_name}\";\n")
-        file.write("\t\t\t\tPRODUCT_NAME = \"$(TARGET_NAME:c99extidentifier)\";\n")
-        file.write("\t\t\t\tSKIP_INSTALL = YES;\n")
-        file.write("\t\t\t\tSWIFT_EMIT_LOC_STRINGS = YES;\n")
-        file.write("\t\t\t\tTARGETED_DEVICE_FAMILY = \"1,2\";\n")
-        file.write("\t\t\t\tVERSIONING_SYSTEM = \"apple-generic\";\n")
-        file.write("\t\t\t};\n")
-        file.write("\t\t\tname = Debug;\n")
-        file.write("\t\t};\n")
-        
-        # Target Release配置
-        file.write(f"\t\t{target_release_uuid} /* Release */ = {{\n")
-        file.write("\t\t\tisa = XCBuildConfiguration;\n")
-        file.write("\t\t\tbuildSettings = {\n")
-        file.write(f"\t\t\t\tINFOPLIST_FILE = \"{info_plist_path or '$(SRCROOT)/Info.plist'}\";\n")
-        file.write("\t\t\t\tCODE_SIGN_STYLE = Automatic;\n")
-        file.write("\t\t\t\tCURRENT_PROJECT_VERSION = 1;\n")
-        file.write("\t\t\t\tDEFINES_MODULE = YES;\n")
-        file.write("\t\t\t\tDYLIB_COMPATIBILITY_VERSION = 1;\n")
-        file.write("\t\t\t\tDYLIB_CURRENT_VERSION = 1;\n")
-        file.write("\t\t\t\tDYLIB_INSTALL_NAME_BASE = \"@rpath\";\n")
-        file.write("\t\t\t\tINFOPLIST_KEY_NSHumanReadableCopyright = \"\";\n")
-        file.write("\t\t\t\tINSTALL_PATH = \"$(LOCAL_LIBRARY_DIR)/Frameworks\";\n")
-        file.write("\t\t\t\tLD_RUNPATH_SEARCH_PATHS = (\n")
-        file.write("\t\t\t\t\t\"$(inherited)\",\n")
-        file.write("\t\t\t\t\t\"@executable_path/Frameworks\",\n")
-        file.write("\t\t\t\t\t\"@loader_path/Frameworks\",\n")
-        file.write("\t\t\t\t);\n")
-        file.write("\t\t\t\tMARKETING_VERSION = 1.0;\n")
-        file.write(f"\t\t\t\tPRODUCT_BUNDLE_IDENTIFIER = \"com.example.{framework_name}\";\n")
-        file.write("\t\t\t\tPRODUCT_NAME = \"$(TARGET_NAME:c99extidentifier)\";\n")
-        file.write("\t\t\t\tSKIP_INSTALL = YES;\n")
-        file.write("\t\t\t\tSWIFT_EMIT_LOC_STRINGS = YES;\n")
-        file.write("\t\t\t\tTARGETED_DEVICE_FAMILY = \"1,2\";\n")
-        file.write("\t\t\t\tVERSIONING_SYSTEM = \"apple-generic\";\n")
-        file.write("\t\t\t};\n")
-        file.write("\t\t\tname = Release;\n")
-        file.write("\t\t};\n")
-        file.write("/* End XCBuildConfiguration section */\n")
-        
-        # XCConfigurationList section
-        file.write("\n/* Begin XCConfigurationList section */\n")
-        file.write(f"\t\t{project_config_list_uuid} /* Build configuration list for PBXProject \"{framework_name}\" */ = {{\n")
-        file.write("\t\t\tisa = XCConfigurationList;\n")
-        file.write("\t\t\tbuildConfigurations = (\n")
-        file.write(f"\t\t\t\t{project_debug_uuid} /* Debug */,\n")
-        file.write(f"\t\t\t\t{project_release_uuid} /* Release */,\n")
-        file.write("\t\t\t);\n")
-        file.write("\t\t\tdefaultConfigurationIsVisible = 0;\n")
-        file.write("\t\t\tdefaultConfigurationName = Release;\n")
-        file.write("\t\t};\n")
-        
-        file.write(f"\t\t{target_config_list_uuid} /* Build configuration list for PBXNativeTarget \"{framework_name}\" */ = {{\n")
-        file.write("\t\t\tisa = XCConfigurationList;\n")
-        file.write("\t\t\tbuildConfigurations = (\n")
-        file.write(f"\t\t\t\t{target_debug_uuid} /* Debug */,\n")
-        file.write(f"\t\t\t\t{target_release_uuid} /* Release */,\n")
-        file.write("\t\t\t);\n")
-        file.write("\t\t\tdefaultConfigurationIsVisible = 0;\n")
-        file.write("\t\t\tdefaultConfigurationName = Release;\n")
-        file.write("\t\t};\n")
-        file.write("/* End XCConfigurationList section */\n")
-        
-        # 文件结尾
-        file.write("\t};\n")
-        file.write(f"\trootObject = {project_uuid} /* Project object */;\n")
-        file.write("}\n")
+    def _render_pbxproj_template(self, framework_name: str, source_files: Dict[str, List[str]], info_plist_path: str = None) -> str:
+        """使用模板生成pbxproj文件内容"""
+        
+        # 文件名去重并只排序一次，各段按同一顺序输出，结果不依赖文件系统遍历顺序
+        header_names = sorted(set(source_files['headers']))
+        source_names = sorted(set(source_files['sources']))
+        
+        # 生成UUID：固定 15 个 + 每个文件 2 个，一次性批量生成
+        uuids = _generate_uuid_batch(15 + 2 * (len(header_names) + len(source_names)))
+        
+        (project_uuid, target_uuid, main_group_uuid, framework_group_uuid,
+         products_group_uuid, product_ref_uuid, headers_phase_uuid,
+         sources_phase_uuid, frameworks_phase_uuid, project_config_list_uuid,
+         target_config_list_uuid, project_debug_uuid, project_release_uuid,
+         target_debug_uuid, target_release_uuid) = uuids[:15]
+        
+        # 为每个文件分配UUID：文件引用与构建文件UUID交替排列，一次切片得到平行列表
+        header_end = 15 + 2 * len(header_names)
+        records_h = list(zip(header_names, uuids[15:header_end:2], uuids[16:header_end:2]))
+        records_s = list(zip(source_names, uuids[header_end::2], uuids[header_end + 1::2]))
+        
+        # 按文件生成的动态片段：头文件、源文件各遍历一次，同时填充各段
+        build_file_lines = []
+        file_reference_lines = []
+        group_children_lines = []
+        headers_phase_lines = []
+        sources_phase_lines = []
+        
+        for n, uid, buid in records_h:
+            build_file_lines.append(LINE_HEADER_BUILD_FILE.format(name=n, uid=uid, buid=buid))
+            file_reference_lines.append(LINE_HEADER_FILE_REFERENCE.format(name=n, uid=uid))
+            group_children_lines.append(LINE_GROUP_CHILD.format(name=n, uid=uid))
+            headers_phase_lines.append(LINE_HEADERS_PHASE_FILE.format(name=n, buid=buid))
+        
+        for n, uid, buid in records_s:
+            build_file_lines.append(LINE_SOURCE_BUILD_FILE.format(name=n, uid=uid, buid=buid))
+            file_reference_lines.append(LINE_SOURCE_FILE_REFERENCE.format(name=n, uid=uid))
+            group_children_lines.append(LINE_GROUP_CHILD.format(name=n, uid=uid))
+            sources_phase_lines.append(LINE_SOURCES_PHASE_FILE.format(name=n, buid=buid))
+        
+        ctx = {
+            'framework_name': framework_name,
+            'info_plist_path': info_plist_path or '$(SRCROOT)/Info.plist',
+            'project_uuid': project_uuid,
+            'target_uuid': target_uuid,
+            'main_group_uuid': main_group_uuid,
+            'framework_group_uuid': framework_group_uuid,
+            'products_group_uuid': products_group_uuid,
+            'product_ref_uuid': product_ref_uuid,
+            'headers_phase_uuid': headers_phase_uuid,
+            'sources_phase_uuid': sources_phase_uuid,
+            'frameworks_phase_uuid': frameworks_phase_uuid,
+            'project_config_list_uuid': project_config_list_uuid,
+            'target_config_list_uuid': target_config_list_uuid,
+            'project_debug_uuid': project_debug_uuid,
+            'project_release_uuid': project_release_uuid,
+            'target_debug_uuid': target_debug_uuid,
+            'target_release_uuid': target_release_uuid,
+            'build_file_section': "".join(build_file_lines),
+            'file_reference_section': "".join(file_reference_lines),
+            'group_children': "".join(group_children_lines),
+            'headers_phase_files': "".join(headers_phase_lines),
+            'sources_phase_files': "".join(sources_phase_lines),
+        }
+        return self._pbxproj_skeleton.format_map(ctx)
     
     def _generate_schemes(self, project_dir: Path, config: Dict[str, Any]):
         """生成Scheme文件"""
@@ -511,64 +704,10 @@ class XcodeProjectGenerator:
         framework_name = config['framework_name']
         scheme_path = schemes_dir / f"{framework_name}.xcscheme"
         
-        scheme_content = f'''<?xml version="1.0" encoding="UTF-8"?>
-<Scheme
-   LastUpgradeVersion = "1500"
-   version = "1.3">
-   <BuildAction
-      parallelizeBuildables = "YES"
-      buildImplicitDependencies = "YES">
-      <BuildActionEntries>
-         <BuildActionEntry
-            buildForTesting = "YES"
-            buildForRunning = "YES"
-            buildForProfiling = "YES"
-            buildForArchiving = "YES"
-            buildForAnalyzing = "YES">
-            <BuildableReference
-               BuildableIdentifier = "primary"
-               BlueprintIdentifier = "{self._generate_uuid()}"
-               BuildableName = "{framework_name}.framework"
-               BlueprintName = "{framework_name}"
-               ReferencedContainer = "container:{framework_name}.xcodeproj">
-            </BuildableReference>
-         </BuildActionEntry>
-      </BuildActionEntries>
-   </BuildAction>
-   <TestAction
-      buildConfiguration = "Debug"
-      selectedDebuggerIdentifier = "Xcode.DebuggerFoundation.Debugger.LLDB"
-      selectedLauncherIdentifier = "Xcode.DebuggerFoundation.Launcher.LLDB"
-      shouldUseLaunchSchemeArgsEnv = "YES">
-      <Testables>
-      </Testables>
-   </TestAction>
-   <LaunchAction
-      buildConfiguration = "Debug"
-      selectedDebuggerIdentifier = "Xcode.DebuggerFoundation.Debugger.LLDB"
-      selectedLauncherIdentifier = "Xcode.DebuggerFoundation.Launcher.LLDB"
-      launchStyle = "0"
-      useCustomWorkingDirectory = "NO"
-      ignoresPersistentStateOnLaunch = "NO"
-      debugDocumentVersioning = "YES"
-      debugServiceExtension = "internal"
-      allowLocationSimulation = "YES">
-   </LaunchAction>
-   <ProfileAction
-      buildConfiguration = "Release"
-      shouldUseLaunchSchemeArgsEnv = "YES"
-      savedToolIdentifier = ""
-      useCustomWorkingDirectory = "NO"
-      debugDocumentVersioning = "YES">
-   </ProfileAction>
-   <AnalyzeAction
-      buildConfiguration = "Debug">
-   </AnalyzeAction>
-   <ArchiveAction
-      buildConfiguration = "Release"
-      revealArchiveInOrganizer = "YES">
-   </ArchiveAction>
-</Scheme>'''
+        scheme_content = SCHEME_TEMPLATE.format_map({
+            'framework_name': framework_name,
+            'blueprint_uuid': self._generate_uuid()
+        })
         
         with open(scheme_path, 'w', encoding='utf-8') as f:
             f.write(scheme_content)
@@ -582,20 +721,19 @@ class XcodeProjectGenerator:
         contents_path = workspace_dir / "contents.xcworkspacedata"
         framework_name = config['framework_name']
         
-        workspace_content = f'''<?xml version="1.0" encoding="UTF-8"?>
-<Workspace
-   version = "1.0">
-   <FileRef
-      location = "self:{framework_name}.xcodeproj">
-   </FileRef>
-</Workspace>'''
+        workspace_content = WORKSPACE_TEMPLATE.format_map({'framework_name': framework_name})
         
         with open(contents_path, 'w', encoding='utf-8') as f:
             f.write(workspace_content)
     
     def _generate_uuid(self) -> str:
         """生成24位UUID（Xcode格式）"""
-        return uuid.uuid4().hex[:24].upper()
+        return os.urandom(12).hex().upper()
+
+
+def _generate_one(config: Dict[str, Any], output_dir: str) -> bool:
+    """子进程入口：生成单个Xcode项目"""
+    return XcodeProjectGenerator().generate_project(config, output_dir)
 
 
 def main():